@@ -1,9 +1,45 @@
 import tkinter as tk
 from PIL import Image, ImageTk
 import math
+import os
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
 MIN_SIZE = 30
+MIN_STRIPE_HEIGHT = 64  # Smallest stripe (in canvas pixels) worth handing off to a worker thread
+
+
+def _available_cpus():
+    """
+    Counts the CPUs this process may run on, respecting CPU affinity (e.g. taskset or container limits)
+    Returns:
+        count (int): Number of usable CPUs
+    """
+    if hasattr(os, 'process_cpu_count'):  # Python 3.13+
+        return os.process_cpu_count() or 1
+    if hasattr(os, 'sched_getaffinity'):  # Not available on Windows or macOS
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _nearest_rows(src_len, dst_len):
+    """
+    Computes the source index sampled by each output index when resizing with Image.NEAREST.
+    Mirrors Pillow's own computation (start at half a step, then accumulate the step), so a frame assembled
+    from stripes of these rows is identical to a single-pass resize.
+    Args:
+        src_len (int): Length of the source axis
+        dst_len (int): Length of the resized axis
+    Returns:
+        rows (ndarray): Source index for each output index
+    """
+    step = src_len / dst_len
+    coords = np.full(dst_len, step)
+    coords[0] = step*0.5
+    return np.cumsum(coords).astype(int)  # Sequential sum, matching Pillow's rounding
+
+
+RENDER_THREADS = _available_cpus()  # Number of threads used to render the visible region
 
 
 class CanvasImage:
@@ -14,6 +50,7 @@ class CanvasImage:
     show_overlay = True  # Whether to display mask overlay
     contrast = 1.0  # Contrast for the viewers
     brightness = 0  # Brightness for the viewers
+    _render_pool = None  # Shared pool for striped rendering, created on first use
 
     def __init__(self, frame, img):
         self.imscale = 1.0  # Scale for the canvas image zoom
@@ -23,8 +60,6 @@ class CanvasImage:
         self.imframe = tk.Frame(frame)  # Frame used as a placeholder
         self.lam_overlay = np.zeros(img.size, dtype=np.uint8).T  # Mask used to overlay with the image
         self.spc_overlay = np.zeros(img.size, dtype=np.uint8).T
-        self.zero_layer = np.zeros(self.lam_overlay.shape, dtype=np.uint8)
-        self.overlay_img = Image.fromarray(np.dstack((self.lam_overlay, self.zero_layer, self.zero_layer, self.lam_overlay)))  # Overlay image
 
         # Create canvas
         self.canvas = tk.Canvas(self.imframe, highlightthickness=0, bd=0, cursor='arrow')
@@ -130,25 +165,66 @@ class CanvasImage:
             self.img_origin = np.array([origin_x, origin_y], dtype=int)
 
             # Update image
-            resized_img = image.resize((int(x2-x1), int(y2-y1)), self._filter)
-            contrast_img = resized_img.point(lambda l: l*CanvasImage.contrast+CanvasImage.brightness)
-
-            if CanvasImage.show_overlay:  # Overlay to be shown
-                self.overlay_img = Image.fromarray(np.maximum(np.dstack((self.lam_overlay, self.zero_layer, self.zero_layer, self.lam_overlay)),
-                                                              np.dstack((self.zero_layer, self.spc_overlay, self.spc_overlay, self.spc_overlay))))
-                proc_overlay = self.overlay_img.crop((new_x1, new_y1,
-                                                      new_x2, new_y2))
-                proc_overlay = proc_overlay.resize((int(x2-x1), int(y2-y1)), self._filter)
-
-                imagetk = ImageTk.PhotoImage(Image.alpha_composite(contrast_img.convert('RGBA'), proc_overlay))
-            else:
-                imagetk = ImageTk.PhotoImage(contrast_img)
+            imagetk = ImageTk.PhotoImage(self._render(image, (new_x1, new_y1), (int(x2-x1), int(y2-y1))))
             self.canvas.imageid = self.canvas.create_image(max(box_canvas[0], box_img_int[0]),
                                                            max(box_canvas[1], box_img_int[1]),
                                                            anchor='nw', image=imagetk)
             self.canvas.lower(self.canvas.imageid)  # Set image into background
             self.canvas.imagetk = imagetk
 
+    def _render(self, image, origin, size):
+        """
+        Resizes the visible region to the canvas size, applying contrast/brightness and blending the mask
+        overlay on top. Large regions are split into horizontal stripes rendered on a thread pool.
+        Each stripe gathers its sampled source rows and only scales horizontally, so the frame does not depend
+        on how many stripes it was split into.
+        Args:
+            image (PIL Image): Cropped visible region of the image
+            origin (tuple): X and y coordinates of the visible region in the overlay masks
+            size (tuple): Width and height of the rendered region on the canvas
+        Returns:
+            frame (PIL Image): Rendered region
+        """
+        width, height = size
+        num_stripes = max(1, min(RENDER_THREADS, height // MIN_STRIPE_HEIGHT))
+        bounds = [height*i // num_stripes for i in range(num_stripes + 1)]
+        rows = _nearest_rows(image.height, height)  # Source row shown on each canvas row
+        src = np.asarray(image)
+        ov_x1, ov_y1 = origin
+        ov_x2 = ov_x1 + image.width
+
+        def render_stripe(top, bottom):
+            stripe_rows = rows[top:bottom]
+            stripe = Image.fromarray(src[stripe_rows]).resize((width, bottom-top), self._filter)
+            stripe = stripe.point(lambda l: l*CanvasImage.contrast+CanvasImage.brightness)
+            if CanvasImage.show_overlay:  # Overlay to be shown
+                # Only build the overlay for the rows of the masks visible in this stripe
+                lam = self.lam_overlay[ov_y1 + stripe_rows, ov_x1:ov_x2]
+                spc = self.spc_overlay[ov_y1 + stripe_rows, ov_x1:ov_x2]
+                overlay = np.empty(lam.shape + (4,), dtype=np.uint8)
+                overlay[..., 0] = lam
+                overlay[..., 1] = spc
+                overlay[..., 2] = spc
+                np.maximum(lam, spc, out=overlay[..., 3])
+                overlay = Image.fromarray(overlay, 'RGBA').resize((width, bottom-top), self._filter)
+
+                # Pasting with a mask gives the same result as Image.alpha_composite onto an opaque image,
+                # but releases the GIL
+                stripe = stripe.convert('RGB')
+                stripe.paste(overlay, (0, 0), overlay)
+            return stripe
+
+        if num_stripes == 1:  # Not worth splitting
+            return render_stripe(0, height)
+
+        if CanvasImage._render_pool is None:
+            CanvasImage._render_pool = ThreadPoolExecutor(max_workers=RENDER_THREADS)
+        stripes = list(CanvasImage._render_pool.map(render_stripe, bounds[:-1], bounds[1:]))
+        frame = Image.new(stripes[0].mode, size)
+        for top, stripe in zip(bounds, stripes):
+            frame.paste(stripe, (0, top))
+        return frame
+
     def outside(self, x, y):
         """
         Checks if the point (x, y) is outside of the image area
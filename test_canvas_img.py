@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+import canvas_img
+from canvas_img import CanvasImage
+
+# (source width, source height, canvas width, canvas height), mostly non-integer scale ratios
+SIZES = [
+    (3000, 2000, 1920, 1080),
+    (500, 700, 1300, 1900),
+    (1234, 987, 3840, 2160),
+    (640, 640, 640, 640),
+]
+
+
+def make_view(src_w, src_h, seed=0):
+    """ CanvasImage with random overlay masks, without creating any Tk widgets """
+    rng = np.random.default_rng(seed)
+    view = CanvasImage.__new__(CanvasImage)
+    view._filter = Image.NEAREST
+    view.lam_overlay = np.where(rng.random((src_h, src_w)) < 0.3, rng.integers(0, 256, (src_h, src_w)), 0).astype(np.uint8)
+    view.spc_overlay = np.where(rng.random((src_h, src_w)) < 0.3, rng.integers(0, 256, (src_h, src_w)), 0).astype(np.uint8)
+    image = Image.fromarray(rng.integers(0, 256, (src_h, src_w), dtype=np.uint8))
+    return view, image
+
+
+def reference_render(view, image, size, show_overlay):
+    """ Single-pass render as done before striping """
+    frame = image.resize(size, view._filter).point(lambda l: l*CanvasImage.contrast+CanvasImage.brightness)
+    if not show_overlay:
+        return frame
+    zero = np.zeros(view.lam_overlay.shape, dtype=np.uint8)
+    overlay = Image.fromarray(np.maximum(np.dstack((view.lam_overlay, zero, zero, view.lam_overlay)),
+                                         np.dstack((zero, view.spc_overlay, view.spc_overlay, view.spc_overlay))))
+    return Image.alpha_composite(frame.convert('RGBA'), overlay.resize(size, view._filter)).convert('RGB')
+
+
+@pytest.mark.parametrize('src_len, dst_len', [(2000, 1080), (700, 1900), (987, 2160), (5, 4096), (1080, 1080)])
+def test_nearest_rows_matches_pillow(src_len, dst_len):
+    column = Image.fromarray(np.arange(src_len, dtype=np.int32)[:, None], 'I')
+    expected = np.asarray(column.resize((1, dst_len), Image.NEAREST))[:, 0]
+    np.testing.assert_array_equal(canvas_img._nearest_rows(src_len, dst_len), expected)
+
+
+@pytest.mark.parametrize('show_overlay', [False, True])
+@pytest.mark.parametrize('threads', [1, 3, 8, 13])
+@pytest.mark.parametrize('src_w, src_h, dst_w, dst_h', SIZES)
+def test_striped_render_matches_single_pass(monkeypatch, src_w, src_h, dst_w, dst_h, threads, show_overlay):
+    monkeypatch.setattr(canvas_img, 'RENDER_THREADS', threads)
+    monkeypatch.setattr(CanvasImage, 'show_overlay', show_overlay)
+    view, image = make_view(src_w, src_h)
+
+    frame = view._render(image, (0, 0), (dst_w, dst_h))
+    expected = reference_render(view, image, (dst_w, dst_h), show_overlay)
+    assert frame.mode == expected.mode
+    np.testing.assert_array_equal(np.asarray(frame), np.asarray(expected))
+
+
+def test_render_uses_overlay_at_origin(monkeypatch):
+    monkeypatch.setattr(canvas_img, 'RENDER_THREADS', 4)
+    monkeypatch.setattr(CanvasImage, 'show_overlay', True)
+    view, image = make_view(800, 600)
+    box = (100, 50, 500, 450)
+
+    frame = view._render(image.crop(box), box[:2], (1000, 1000))
+    view.lam_overlay = view.lam_overlay[box[1]:box[3], box[0]:box[2]]
+    view.spc_overlay = view.spc_overlay[box[1]:box[3], box[0]:box[2]]
+    expected = reference_render(view, image.crop(box), (1000, 1000), True)
+    np.testing.assert_array_equal(np.asarray(frame), np.asarray(expected))